@@ -0,0 +1,123 @@
+# background.py
+from __future__ import annotations
+from pathlib import Path
+
+import arcade
+from arcade.gl import geometry
+
+_VERTEX_SHADER = """#version 330
+in vec2 in_vert;
+in vec2 in_uv;
+out vec2 uv;
+void main() {
+    gl_Position = vec4(in_vert, 0.0, 1.0);
+    uv = in_uv;
+}
+"""
+
+_FRAGMENT_SHADER = """#version 330
+uniform sampler2D u_texture;
+uniform float u_offset;  // horizontal scroll, in repeats of the texture
+uniform float u_scale;   // window width, in repeats of the texture
+in vec2 uv;
+out vec4 fragColor;
+void main() {
+    fragColor = texture(u_texture, vec2(uv.x * u_scale + u_offset, uv.y));
+}
+"""
+
+# Views are rebuilt on every menu/game switch, so the GL textures and the
+# compiled programs are memoized at module level (like textures.py does for
+# sprite textures); each instance only builds its own quad and uniforms.
+_GL_TEXTURES: dict[str, arcade.gl.Texture2D] = {}
+_PROGRAMS: dict[str, arcade.gl.Program] = {}
+
+
+def _repeat_texture(ctx, path: str | Path) -> arcade.gl.Texture2D:
+    key = str(path)
+    tex = _GL_TEXTURES.get(key)
+    if tex is None:
+        tex = ctx.load_texture(path, wrap_x=ctx.REPEAT)
+        _GL_TEXTURES[key] = tex
+    return tex
+
+
+def _program(ctx, vertex_shader: str) -> arcade.gl.Program:
+    prog = _PROGRAMS.get(vertex_shader)
+    if prog is None:
+        prog = ctx.program(vertex_shader=vertex_shader,
+                           fragment_shader=_FRAGMENT_SHADER)
+        _PROGRAMS[vertex_shader] = prog
+    return prog
+
+
+class ScrollingBackground:
+    """Horizontally scrolling background drawn as a single fullscreen quad.
+
+    The texture is scaled to the window height and sampled with a wrapped
+    UV offset, so scrolling costs one uniform update per frame instead of
+    moving and wrap-checking background sprites.
+    """
+
+    def __init__(self, path: str | Path, speed: float):
+        window = arcade.get_window()
+        ctx = window.ctx
+        self.speed = speed
+        self.offset = 0.0
+        self._texture = _repeat_texture(ctx, path)
+        scale = window.height / self._texture.height
+        self._width = self._texture.width * scale  # on-screen width of one repeat
+        self._u_scale = window.width / self._width
+        self._program = _program(ctx, _VERTEX_SHADER)
+        self._quad = geometry.quad_2d_fs()
+
+    def update(self, dt: float):
+        self.offset += self.speed * dt
+
+    def draw(self):
+        # The program is shared between instances, so all uniforms are set
+        # here rather than at construction.
+        self._texture.use(0)
+        self._program["u_scale"] = self._u_scale
+        self._program["u_offset"] = self.offset / self._width
+        self._quad.render(self._program)
+
+_BAND_VERTEX_SHADER = """#version 330
+in vec2 in_vert;
+in vec2 in_uv;
+uniform float u_dy;  // vertical screen shift (camera shake), in NDC
+out vec2 uv;
+void main() {
+    gl_Position = vec4(in_vert.x, in_vert.y + u_dy, 0.0, 1.0);
+    uv = in_uv;
+}
+"""
+
+
+class TiledBand:
+    """Horizontal band of a repeating texture drawn as a single quad.
+
+    Replaces a row of identical tile sprites: the world-x offset becomes a
+    wrapped UV phase, so scrolling costs one uniform update instead of
+    moving and recycling tiles.
+    """
+
+    def __init__(self, path: str | Path, top: float):
+        window = arcade.get_window()
+        ctx = window.ctx
+        self._texture = _repeat_texture(ctx, path)
+        self._tile_w = self._texture.width
+        self._win_h = window.height
+        self._u_scale = window.width / self._tile_w
+        self._program = _program(ctx, _BAND_VERTEX_SHADER)
+        bottom = top - self._texture.height
+        ndc_h = (top - bottom) / window.height * 2
+        ndc_cy = (bottom + top) / window.height - 1
+        self._quad = geometry.quad_2d(size=(2.0, ndc_h), pos=(0.0, ndc_cy))
+
+    def draw(self, offset_x: float, shift_y: float = 0.0):
+        self._texture.use(0)
+        self._program["u_scale"] = self._u_scale
+        self._program["u_offset"] = offset_x / self._tile_w
+        self._program["u_dy"] = shift_y / self._win_h * 2
+        self._quad.render(self._program)
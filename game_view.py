@@ -1,40 +1,93 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from bisect import bisect_left
+from collections import deque
+from itertools import accumulate
+from operator import attrgetter
 from pathlib import Path
 import random
 import math
 import arcade
+from arcade import shape_list
 
 from settings import (
     WIDTH, HEIGHT,
     DEFAULT_SCROLL_SPEED, FLOOR_Y, PLAYER_SIZE, PLAYER_X,
     GRAVITY, JUMP_VEL, COYOTE_TIME, JUMP_BUFFER,
-    GROUND, PLAYER_COLOR, OBST,
+    PLAYER_COLOR, OBST,
     WHITE, PINK, GRAY, GOLD, COIN_SIZE
 )
+from background import ScrollingBackground, TiledBand
 from level_loader import load_level
+from textures import load_texture
+from menu_view import MenuView
 from pause_view import PauseView
 
 SPAWN_START = WIDTH + 80
 OB_H = 36
 ASSETS_DIR = Path(__file__).parent / "assets"
 
-@dataclass
-class Particle:
-    x: float; y: float; vx: float; vy: float
-    life: float; start_life: float; radius: float
-    color: tuple[int, int, int, int]
-    def update(self, dt: float, gravity: float = 0.0):
+# Precomputed unit directions for ring-shaped particle bursts; indexing this
+# table replaces two math.cos/math.sin calls per emitted particle.
+_RING_DIRS = [(math.cos(i * math.tau / 64), math.sin(i * math.tau / 64)) for i in range(64)]
+
+_sprite_x = attrgetter("center_x")
+
+# White circle textures shared by all particles, keyed by rounded radius, so
+# each particle pool renders as one batched SpriteList draw call.
+_CIRCLE_TEXTURES: dict[int, arcade.Texture] = {}
+
+def _circle_texture(radius: float) -> arcade.Texture:
+    key = max(2, int(round(radius)))
+    tex = _CIRCLE_TEXTURES.get(key)
+    if tex is None:
+        tex = arcade.make_circle_texture(key * 2, (255, 255, 255, 255))
+        _CIRCLE_TEXTURES[key] = tex
+    return tex
+
+class Particle(arcade.Sprite):
+    def __init__(self, x: float, y: float, vx: float, vy: float,
+                 life: float, radius: float, color: tuple[int, int, int, int],
+                 gravity: float = 0.0):
+        super().__init__(_circle_texture(radius))
+        self.center_x = x; self.center_y = y
+        self.width = radius * 2; self.height = radius * 2
+        self.vx = vx; self.vy = vy
+        self.gravity = gravity
+        self.life = life; self.start_life = life
+        r, g, b, a = color
+        self.color = (r, g, b)
+        self.base_alpha = a
+        self.alpha = a
+    def step(self, dt: float):
         self.life -= dt
-        self.vy += gravity * dt
-        self.x += self.vx * dt
-        self.y += self.vy * dt
+        self.vy += self.gravity * dt
+        self.center_x += self.vx * dt
+        self.center_y += self.vy * dt
+        t = max(0.0, min(1.0, self.life / self.start_life))
+        self.alpha = int(self.base_alpha * t)
     @property
     def alive(self) -> bool: return self.life > 0
-    def draw(self, dx: float = 0.0, dy: float = 0.0):
-        t = max(0.0, min(1.0, self.life / self.start_life))
-        r,g,b,a = self.color
-        arcade.draw_circle_filled(self.x + dx, self.y + dy, self.radius, (r, g, b, int(a * t)))
+
+class SpeedPortal(arcade.Sprite):
+    """Trigger that sets the world scroll speed on touch."""
+    def __init__(self, texture: arcade.Texture, x: float, y: float, speed: float):
+        super().__init__(texture)
+        self.center_x = x; self.center_y = y
+        self.speed = speed
+
+class GravityPortal(arcade.Sprite):
+    """Trigger that flips gravity to its direction (+1 normal, -1 inverted)."""
+    def __init__(self, texture: arcade.Texture, x: float, y: float, dir: int):
+        super().__init__(texture)
+        self.center_x = x; self.center_y = y
+        self.dir = 1 if dir >= 0 else -1
+
+class JumpPad(arcade.Sprite):
+    """Trigger that launches the player with a scaled jump velocity."""
+    def __init__(self, texture: arcade.Texture, x: float, y: float, strength: float):
+        super().__init__(texture)
+        self.center_x = x; self.center_y = y
+        self.strength = max(0.2, strength)
 
 class GameView(arcade.View):
     def __init__(self, level_path: str | None = None):
@@ -42,18 +95,37 @@ class GameView(arcade.View):
         self.level_path = level_path or (Path(__file__).parent / "level" / "level1.json")
         self.scroll_speed = DEFAULT_SCROLL_SPEED
 
+        # World scrolling is done by panning this camera; sprites keep their
+        # world coordinates instead of being moved one by one every frame.
+        self.camera = arcade.Camera2D()
+        self.world_left = 0.0  # world x of the view's left edge
+
+        # Background: one UV-scrolled quad, no sprites to move or wrap
+        self.background = ScrollingBackground(ASSETS_DIR / "background.png", speed=30.0)
+
+        # Ground: one repeating-texture band quad; built in setup() once the
+        # level's floor height is known.
+        self.ground: TiledBand | None = None
+
         # Sprite containers
-        self.bg_list = arcade.SpriteList(False)
-        self.ground_tiles = arcade.SpriteList(False)
-        self.ground_collision = arcade.SpriteList(True)
-        self.ceiling_collision = arcade.SpriteList(True)     # for inverted gravity
-        self.obstacles = arcade.SpriteList(True)
+        # No spatial hashing: the only collision query source is the player and
+        # the lists are short, so a linear AABB scan is cheaper than keeping a
+        # hash up to date.
+        # Obstacles render as one batched shape list; collision uses plain
+        # (left, right, bottom, top) tuples kept in ascending x order.
+        self.obstacle_shapes = shape_list.ShapeElementList()
+        self.obstacle_rects: deque[tuple[float, float, float, float]] = deque()
+        # Shapes in the same order as the rects, so pruning a rect can drop
+        # its shape from the batched list too.
+        self._obstacle_shape_q: deque[shape_list.Shape] = deque()
         self.spikes = arcade.SpriteList(False)
+        self._spike_pool: list[arcade.Sprite] = []  # recycled across restarts
+        self._coin_pool: list[arcade.Sprite] = []
         self.player_list = arcade.SpriteList(False)
-        self.coins = arcade.SpriteList(True)
-        self.portals = arcade.SpriteList(True)               # speed portals (visible now)
-        self.gravity_portals = arcade.SpriteList(True)       # gravity portals (visible)
-        self.jump_pads = arcade.SpriteList(True)             # jump pads (visible)
+        self.coins = arcade.SpriteList(False)
+        self.portals = arcade.SpriteList(False)              # speed portals (visible now)
+        self.gravity_portals = arcade.SpriteList(False)      # gravity portals (visible)
+        self.jump_pads = arcade.SpriteList(False)            # jump pads (visible)
 
         # Player / physics
         self.player: arcade.Sprite | None = None
@@ -67,134 +139,145 @@ class GameView(arcade.View):
         self.alive = True
         self.time_alive = 0.0
         self.score = 0
-        self.next_spawn_x = SPAWN_START
 
-        # UI text
+        # Obstacle streaming cursor: index of the next plan entry to spawn
+        self._obstacle_i = 0
+
+        # UI text; the game-over labels are laid out lazily on first death
+        # so startup never pays for glyphs that may never be shown.
         self.score_text = arcade.Text("", 16, HEIGHT - 36, WHITE, 18)
-        self.dead_text = arcade.Text("You Died  -  Press R to Restart",
-                                     WIDTH / 2, HEIGHT / 2 + 40, PINK, 28, anchor_x="center")
-        self.help_text = arcade.Text("SPACE/Click = Jump   ESC = Pause   M = Menu",
-                                     WIDTH / 2, HEIGHT / 2 - 6, GRAY, 18, anchor_x="center")
+        self._score_shown = -1  # last value laid out into score_text
+        self.dead_text: arcade.Text | None = None
+        self.help_text: arcade.Text | None = None
 
         # Level data
         self.level_data = None
-        self.obstacle_plan: list[tuple[int, int]] = []
+        self.obstacle_plan: list[tuple[int, int]] = []  # (spawn x, width)
         self.coin_plan: list[tuple[int, int]] = []
         self.portal_plan: list[tuple[int, float]] = []        # speed portals
         self.gravity_plan: list[tuple[int, int]] = []         # (x, dir)
         self.jump_pad_plan: list[tuple[int, float]] = []      # (x, strength)
 
-        # Textures
-        self.tex_bg = arcade.load_texture(str(ASSETS_DIR / "background.png"))
-        self.tex_ground = arcade.load_texture(str(ASSETS_DIR / "ground.png"))
-        self.tex_spike = arcade.load_texture(str(ASSETS_DIR / "spike.png"))
+        # Textures (shared process-wide via the memoized loader)
+        self.tex_spike = load_texture("spike.png")
         self.tex_coin = [
-            arcade.load_texture(str(ASSETS_DIR / "coin1.png")),
-            arcade.load_texture(str(ASSETS_DIR / "coin2.png")),
+            load_texture("coin1.png"),
+            load_texture("coin2.png"),
         ]
-        self.tex_player_idle = arcade.load_texture(str(ASSETS_DIR / "player.png"))
+        self.tex_player_idle = load_texture("player.png")
         self.tex_player_run = [
-            arcade.load_texture(str(ASSETS_DIR / "player_run1.png")),
-            arcade.load_texture(str(ASSETS_DIR / "player_run2.png")),
+            load_texture("player_run1.png"),
+            load_texture("player_run2.png"),
         ]
 
         # NEW textures for triggers
         # If you put my generated PNGs into your assets/ folder, these paths will work.
         # Otherwise, update the paths to wherever you saved them.
-        self.tex_portal_speed = arcade.load_texture(str(ASSETS_DIR / "portal_speed.png"))
-        self.tex_portal_gravity = arcade.load_texture(str(ASSETS_DIR / "portal_gravity.png"))
-        self.tex_pad_jump = arcade.load_texture(str(ASSETS_DIR / "pad_jump.png"))
+        self.tex_portal_speed = load_texture("portal_speed.png")
+        self.tex_portal_gravity = load_texture("portal_gravity.png")
+        self.tex_pad_jump = load_texture("pad_jump.png")
 
         # Animation timers
         self.coin_anim_t = 0.0
         self.player_anim_t = 0.0
 
-        # Particles & camera shake
-        self.dust_particles: list[Particle] = []
-        self.sparkle_particles: list[Particle] = []
-        self.death_particles: list[Particle] = []
+        # Particles & camera shake (SpriteLists so each pool is one draw call)
+        self.dust_particles = arcade.SpriteList(False)
+        self.sparkle_particles = arcade.SpriteList(False)
+        self.death_particles = arcade.SpriteList(False)
         self._dust_accum = 0.0
         self.shake_time = 0.0
         self.shake_intensity = 0.0
 
+        # Trigger scan table: the lists are cleared in place on restart, so
+        # these pairs stay valid for the life of the view.
+        self._trigger_scans = (
+            (self.portals, self._hit_speed_portal),
+            (self.gravity_portals, self._hit_gravity_portal),
+            (self.jump_pads, self._hit_jump_pad),
+        )
+
+        # Key dispatch table; avoids re-reading arcade.key attributes and
+        # walking an if/elif chain on every keypress.
+        self._key_handlers = {
+            arcade.key.SPACE: self._queue_jump,
+            arcade.key.UP: self._queue_jump,
+            arcade.key.R: self.setup,
+            arcade.key.ESCAPE: self._pause,
+            arcade.key.M: self._menu,
+        }
+
         self.setup()
 
     def on_show_view(self): pass
 
     def setup(self):
-        data = load_level(self.level_path)
-        self.level_data = data
+        # Parse the level and build the plans once; restarts (R) reuse them.
+        if self.level_data is None:
+            data = load_level(self.level_path)
+            self.level_data = data
+
+            self.obstacle_plan.clear()
+            default_w = int(data.get("default_obstacle_width", 30))
+            gaps: list[int] = []
+            widths: list[int] = []
+            for item in data["obstacles"]:
+                if isinstance(item, dict):
+                    gaps.append(int(item.get("gap", 240)))
+                    widths.append(int(item.get("width", default_w)))
+                else:
+                    gaps.append(int(item))
+                    widths.append(default_w)
+            # Absolute spawn positions, accumulated once; the streaming
+            # cursor indexes straight into (x, w) pairs instead of keeping a
+            # running sum across frames and restarts.
+            xs = accumulate(gaps[:-1], initial=SPAWN_START)
+            self.obstacle_plan.extend(zip(xs, widths))
+
+            # Sorted by x: pruning, the bisect window and the trigger scans
+            # all rely on it; the level JSON may list entries in any order.
+            self.coin_plan = sorted((int(c["x"]), int(c["y"])) for c in data.get("coins", []))
+            self.portal_plan = sorted((int(p["x"]), float(p["speed"])) for p in data.get("speed_portals", []))
+            self.gravity_plan = sorted((int(p["x"]), int(p.get("dir", -1))) for p in data.get("gravity_portals", []))
+            self.jump_pad_plan = sorted((int(p["x"]), float(p.get("strength", 1.0))) for p in data.get("jump_pads", []))
+
+        data = self.level_data
         self.scroll_speed = float(data.get("scroll_speed", DEFAULT_SCROLL_SPEED))
         floor_y = int(data.get("floor_y", FLOOR_Y))
         player_x = int(data.get("player_x", PLAYER_X))
 
-        self.obstacle_plan.clear()
-        default_w = int(data.get("default_obstacle_width", 30))
-        for item in data["obstacles"]:
-            if isinstance(item, dict):
-                gap = int(item.get("gap", 240)); w = int(item.get("width", default_w))
-            else:
-                gap = int(item); w = default_w
-            self.obstacle_plan.append((gap, w))
-
-        self.coin_plan = [(int(c["x"]), int(c["y"])) for c in data.get("coins", [])]
-        self.portal_plan = [(int(p["x"]), float(p["speed"])) for p in data.get("speed_portals", [])]
-        self.gravity_plan = [(int(p["x"]), int(p.get("dir", -1))) for p in data.get("gravity_portals", [])]
-        self.jump_pad_plan = [(int(p["x"]), float(p.get("strength", 1.0))) for p in data.get("jump_pads", [])]
-
-        # Reset lists
-        self.bg_list = arcade.SpriteList()
-        self.ground_tiles = arcade.SpriteList()
-        self.ground_collision = arcade.SpriteList(use_spatial_hash=True)
-        self.ceiling_collision = arcade.SpriteList(use_spatial_hash=True)
-        self.obstacles = arcade.SpriteList(use_spatial_hash=True)
-        self.spikes = arcade.SpriteList()
-        self.player_list = arcade.SpriteList()
-        self.coins = arcade.SpriteList(use_spatial_hash=True)
-        self.portals = arcade.SpriteList(use_spatial_hash=True)
-        self.gravity_portals = arcade.SpriteList(use_spatial_hash=True)
-        self.jump_pads = arcade.SpriteList(use_spatial_hash=True)
+        # Reset containers in place: SpriteList construction allocates GL
+        # buffers, so restarts reuse the ones made in __init__. Spike sprites
+        # are recycled too, since sprite construction is one of the heavier
+        # operations on restart.
+        self._spike_pool.extend(self.spikes)
+        self._coin_pool.extend(self.coins)
+        self.obstacle_shapes.clear()
+        self._obstacle_shape_q.clear()
+        self.obstacle_rects.clear()
+        self.spikes.clear()
+        self.player_list.clear()
+        self.coins.clear()
+        self.portals.clear()
+        self.gravity_portals.clear()
+        self.jump_pads.clear()
 
         self.dust_particles.clear(); self.sparkle_particles.clear(); self.death_particles.clear()
         self._dust_accum = 0.0; self.shake_time = 0.0; self.shake_intensity = 0.0
 
-        # Background (two tiles)
-        bg_scale = HEIGHT / self.tex_bg.height
-        bg_w = self.tex_bg.width * bg_scale
-        for i in range(2):
-            s = arcade.Sprite()
-            s.texture = self.tex_bg
-            s.scale = bg_scale
-            s.center_x = i * bg_w + bg_w / 2
-            s.center_y = HEIGHT / 2
-            self.bg_list.append(s)
-
-        # Ground & ceiling colliders
-        ground_h = 40
-        g = arcade.SpriteSolidColor(WIDTH * 4, ground_h, GROUND)
-        g.center_x = WIDTH * 2
-        g.center_y = floor_y - ground_h / 2
-        self.ground_collision.append(g)
-
-        c = arcade.SpriteSolidColor(WIDTH * 4, ground_h, (0, 0, 0, 0))
-        c.center_x = WIDTH * 2
-        c.center_y = (HEIGHT - floor_y) + ground_h / 2
-        self.ceiling_collision.append(c)
-
-        # Decorative ground tiles
-        tile_w = self.tex_ground.width
-        tile_h = self.tex_ground.height
-        scale = 1.0
-        span_w = WIDTH * 4 + tile_w
-        x = 0
-        while x < span_w:
-            s = arcade.Sprite()
-            s.texture = self.tex_ground
-            s.scale = scale
-            s.left = x
-            s.bottom = floor_y - tile_h * scale
-            self.ground_tiles.append(s)
-            x += tile_w * scale
+        self.world_left = 0.0
+        self.camera.position = (WIDTH / 2, HEIGHT / 2)
+
+        self.background.offset = 0.0
+
+        # The floor and ceiling are flat, infinite lines; contact tests are
+        # scalar compares against these instead of sprite collisions.
+        self._floor_top = floor_y
+        self._ceiling_bottom = HEIGHT - floor_y
+
+        # Decorative ground band (floor height is fixed across restarts)
+        if self.ground is None:
+            self.ground = TiledBand(ASSETS_DIR / "ground.png", top=floor_y)
 
         # Player
         self.player = arcade.Sprite()
@@ -215,71 +298,88 @@ class GameView(arcade.View):
         self.score = 0
         self.coin_anim_t = 0.0
         self.player_anim_t = 0.0
+        self._coin_frame = 0
+        self._next_coin_flip = 1 / 6
+        self._player_frame = 0
+        self._next_player_flip = 1 / 8
         self.player.angle = 0
+        self._refresh_score_text()
 
-        # Obstacles & spikes
-        x = SPAWN_START
-        for gap, w in self.obstacle_plan:
-            ob = self._create_obstacle(x, w, floor_y)
-            self._create_spikes_for_obstacle(ob)
-            x += gap
-        self.next_spawn_x = x
+        # Obstacles & spikes stream in as the camera approaches; seed the
+        # first screenful here and let on_update pull in the rest.
+        self._obstacle_i = 0
+        self._stream_obstacles(0.0)
 
-        # Coins
+        # Coins (recycled like spikes; restarts only reset positions).
+        # Texture goes on before the size: the texture setter rescales the
+        # sprite from the texture dimensions.
+        pool = self._coin_pool
         for cx, cy in self.coin_plan:
-            ccoin = arcade.Sprite()
-            ccoin.texture = self.tex_coin[0]
+            if pool:
+                ccoin = pool.pop()
+                ccoin.texture = self.tex_coin[0]
+            else:
+                ccoin = arcade.Sprite()
+                ccoin.texture = self.tex_coin[0]
+                ccoin.width = COIN_SIZE; ccoin.height = COIN_SIZE
             ccoin.center_x = cx; ccoin.center_y = cy
-            ccoin.width = COIN_SIZE; ccoin.height = COIN_SIZE
             self.coins.append(ccoin)
 
-        # Visible speed portals
+        # Visible speed portals (straddle the floor for visibility)
         for px, spd in self.portal_plan:
-            s = arcade.Sprite()
-            s.texture = self.tex_portal_speed
-            s.center_x = px
-            # straddle floor for visibility
-            s.center_y = floor_y + self.tex_portal_speed.height * 0.5
-            s.scale = 1.0
-            # collider roughly matches
-            s.properties = {"speed": spd}
-            self.portals.append(s)
+            self.portals.append(SpeedPortal(
+                self.tex_portal_speed, px,
+                floor_y + self.tex_portal_speed.height * 0.5, float(spd)))
 
         # Visible gravity portals
         for px, d in self.gravity_plan:
-            s = arcade.Sprite()
-            s.texture = self.tex_portal_gravity
-            s.center_x = px
-            s.center_y = floor_y + self.tex_portal_gravity.height * 0.5
-            s.scale = 1.0
-            s.properties = {"dir": 1 if d >= 0 else -1}
-            self.gravity_portals.append(s)
+            self.gravity_portals.append(GravityPortal(
+                self.tex_portal_gravity, px,
+                floor_y + self.tex_portal_gravity.height * 0.5, d))
 
         # Visible jump pads (thin)
         for px, strength in self.jump_pad_plan:
-            s = arcade.Sprite()
-            s.texture = self.tex_pad_jump
-            s.center_x = px
-            s.center_y = floor_y + self.tex_pad_jump.height * 0.5
-            s.scale = 1.0
-            s.properties = {"strength": max(0.2, float(strength))}
-            self.jump_pads.append(s)
-
-    def _create_obstacle(self, x, w, floor_y) -> arcade.Sprite:
-        ob = arcade.SpriteSolidColor(w, OB_H, OBST)
-        ob.center_x = x + w / 2
-        ob.center_y = floor_y + OB_H / 2
-        self.obstacles.append(ob)
-        return ob
-
-    def _create_spikes_for_obstacle(self, ob: arcade.Sprite):
-        count = max(1, int(round(ob.width / self.tex_spike.width)))
-        pitch = ob.width / count
+            self.jump_pads.append(JumpPad(
+                self.tex_pad_jump, px,
+                floor_y + self.tex_pad_jump.height * 0.5, float(strength)))
+
+    def _stream_obstacles(self, world_left: float):
+        # Spawn plan entries entering the lookahead window just right of the
+        # view; the rest of the plan stays as plain tuples until needed.
+        plan = self.obstacle_plan
+        i = self._obstacle_i
+        horizon = world_left + WIDTH + 200
+        floor_y = self._floor_top
+        while i < len(plan) and plan[i][0] < horizon:
+            x, w = plan[i]
+            rect = self._create_obstacle(x, w, floor_y)
+            self._create_spikes_for_obstacle(rect)
+            i += 1
+        self._obstacle_i = i
+
+    def _create_obstacle(self, x, w, floor_y) -> tuple[float, float, float, float]:
+        shape = shape_list.create_rectangle_filled(
+            x + w / 2, floor_y + OB_H / 2, w, OB_H, OBST)
+        self.obstacle_shapes.append(shape)
+        self._obstacle_shape_q.append(shape)
+        rect = (float(x), float(x + w), float(floor_y), float(floor_y + OB_H))
+        self.obstacle_rects.append(rect)
+        return rect
+
+    def _create_spikes_for_obstacle(self, rect: tuple[float, float, float, float]):
+        left, right, _bottom, top = rect
+        width = right - left
+        count = max(1, int(round(width / self.tex_spike.width)))
+        pitch = width / count
+        pool = self._spike_pool
         for i in range(count):
-            s = arcade.Sprite()
-            s.texture = self.tex_spike
-            s.center_x = ob.left + pitch * (i + 0.5)
-            s.bottom = ob.top
+            if pool:
+                s = pool.pop()
+            else:
+                s = arcade.Sprite()
+                s.texture = self.tex_spike
+            s.center_x = left + pitch * (i + 0.5)
+            s.bottom = top
             self.spikes.append(s)
 
     def _emit_dust(self, dt: float):
@@ -296,32 +396,47 @@ class GameView(arcade.View):
                 life = 0.35 + random.random() * 0.15
                 r = 2 + random.random() * 2
                 col = (200, 200, 220, 180)
-                self.dust_particles.append(Particle(px, py, vx, vy * self.gravity_dir, life, life, r, col))
+                self.dust_particles.append(Particle(px, py, vx, vy * self.gravity_dir, life, r, col, gravity=-400.0))
 
     def _emit_coin_sparkles(self, x: float, y: float):
         for _ in range(12):
-            ang = random.random() * math.tau
+            ux, uy = _RING_DIRS[int(random.random() * 64)]
             spd = 120 + random.random() * 120
-            vx = math.cos(ang) * spd
-            vy = math.sin(ang) * spd
+            vx = ux * spd
+            vy = uy * spd
             life = 0.4 + random.random() * 0.2
             r = 2 + random.random() * 1.5
             col = (255, 215, 80, 255)
-            self.sparkle_particles.append(Particle(x, y, vx, vy, life, life, r, col))
+            self.sparkle_particles.append(Particle(x, y, vx, vy, life, r, col))
 
     def _emit_death_burst(self, x: float, y: float):
         for _ in range(40):
-            ang = random.random() * math.tau
+            ux, uy = _RING_DIRS[int(random.random() * 64)]
             spd = 150 + random.random() * 250
-            vx = math.cos(ang) * spd
-            vy = math.sin(ang) * spd
+            vx = ux * spd
+            vy = uy * spd
             life = 0.6 + random.random() * 0.4
             r = 2 + random.random() * 3
             col = random.choice([(240, 80, 80, 240), (255, 255, 255, 220)])
-            self.death_particles.append(Particle(x, y, vx, vy, life, life, r, col))
+            self.death_particles.append(Particle(x, y, vx, vy, life, r, col, gravity=-300.0))
         self.shake_time = 0.35
         self.shake_intensity = 6.0
 
+    def _hit_speed_portal(self, portal: SpeedPortal):
+        self.scroll_speed = portal.speed
+
+    def _hit_gravity_portal(self, gport: GravityPortal):
+        if gport.dir != self.gravity_dir:
+            self.gravity_dir = gport.dir
+            self.vel_y = 0.0
+
+    def _hit_jump_pad(self, pad: JumpPad):
+        target_v = JUMP_VEL * self.gravity_dir * pad.strength
+        if (self.gravity_dir > 0 and self.vel_y < target_v) or (self.gravity_dir < 0 and self.vel_y > target_v):
+            self.vel_y = target_v
+        self.on_ground = False
+        self.coyote_timer = 0.0
+
     def _queue_jump(self):
         if not self.alive: return
         self.jump_buffer_timer = JUMP_BUFFER
@@ -334,82 +449,88 @@ class GameView(arcade.View):
         self.coyote_timer = 0.0
         self.jump_buffer_timer = 0.0
 
+    def _pause(self):
+        self.window.show_view(PauseView(self))
+
+    def _menu(self):
+        self.window.show_view(MenuView())
+
     def on_key_press(self, symbol: int, modifiers: int):
-        if symbol in (arcade.key.SPACE, arcade.key.UP):
-            self._queue_jump()
-        elif symbol == arcade.key.R:
-            self.setup()
-        elif symbol == arcade.key.ESCAPE:
-            self.window.show_view(PauseView(self))
-        elif symbol in (arcade.key.M,):
-            from menu_view import MenuView
-            self.window.show_view(MenuView())
+        handler = self._key_handlers.get(symbol)
+        if handler is not None:
+            handler()
 
     def on_mouse_press(self, x: float, y: float, button: int, modifiers: int):
         self._queue_jump()
 
     def on_update(self, dt: float):
+        # Degenerate frames (window drag, un-pause hiccups) can report a zero
+        # dt; nothing they would compute is visible, so skip them outright.
+        if dt <= 0.0:
+            return
         if not self.alive:
-            self._update_particles(dt); self._update_shake(dt); return
+            # Only tick leftover effects; once they are spent the dead state
+            # costs nothing per frame.
+            if (self.dust_particles or self.sparkle_particles
+                    or self.death_particles or self.shake_time > 0.0):
+                self._update_particles(dt); self._update_shake(dt)
+            return
 
         self.time_alive += dt
         self.coin_anim_t += dt
         self.player_anim_t += dt
 
         # Background parallax
-        bg_speed = 30.0
-        dx_bg = bg_speed * dt
-        for s in self.bg_list:
-            s.center_x -= dx_bg
-        if self.bg_list:
-            bg_w = self.bg_list[0].width
-            for s in self.bg_list:
-                if s.right < 0:
-                    s.left += bg_w * 2
-
-        # World scroll
+        self.background.update(dt)
+
+        # Hot-path locals: attribute loads are hoisted out of the per-frame work
+        player = self.player
+
+        # World scroll: pan the camera and carry the player along; everything
+        # else keeps its world coordinates.
         dx = self.scroll_speed * dt
-        for lst in (self.ground_collision, self.ceiling_collision, self.obstacles, self.spikes,
-                    self.coins, self.portals, self.gravity_portals, self.jump_pads, self.ground_tiles):
-            for s in lst:
-                s.center_x -= dx
-
-        # Extend colliders
-        ground = self.ground_collision[0]
-        ceiling = self.ceiling_collision[0]
-        if ground.right < WIDTH * 2:
-            ground.width += int(WIDTH)
-            ceiling.width += int(WIDTH)
-
-        # Recycle ground tiles
-        for t in self.ground_tiles:
-            if t.right < -64:
-                t.left += WIDTH * 4 + 64
-
-        # Prune off-screen
-        for lst in (self.obstacles, self.spikes, self.coins, self.portals, self.gravity_portals, self.jump_pads):
-            for s in list(lst):
-                if s.right < -200:
-                    s.remove_from_sprite_lists()
+        world_left = self.world_left + dx
+        self.world_left = world_left
+        self.camera.position = (world_left + WIDTH / 2, HEIGHT / 2)
+        player.center_x += dx
+
+        # Prune off-screen: each list is kept in ascending x order, so only
+        # its leftmost sprite can ever be out of range — peek instead of scan.
+        # Pruned spikes go back to the pool so streaming reuses them.
+        cutoff = world_left - 200
+        spikes = self.spikes
+        while spikes and spikes[0].right < cutoff:
+            s = spikes[0]
+            s.remove_from_sprite_lists()
+            self._spike_pool.append(s)
+        for lst in (self.coins, self.portals,
+                    self.gravity_portals, self.jump_pads):
+            while lst and lst[0].right < cutoff:
+                lst[0].remove_from_sprite_lists()
+        rects = self.obstacle_rects
+        while rects and rects[0][1] < cutoff:
+            rects.popleft()
+            self.obstacle_shapes.remove(self._obstacle_shape_q.popleft())
+
+        # Stream in obstacles entering the lookahead window
+        if self._obstacle_i < len(self.obstacle_plan):
+            self._stream_obstacles(world_left)
 
         # Vertical physics with gravity sign
         self.vel_y += (-GRAVITY * self.gravity_dir) * dt
-        self.player.center_y += self.vel_y * dt
+        player.center_y += self.vel_y * dt
 
         # Ground/Ceiling contacts
         self.on_ground = False
+        half_h = player.height / 2
         if self.gravity_dir > 0:
-            hits = arcade.check_for_collision_with_list(self.player, self.ground_collision)
-            if hits and self.vel_y <= 0:
-                top = max(h.top for h in hits)
-                self.player.center_y = top + self.player.height / 2
+            if self.vel_y <= 0 and player.center_y - half_h <= self._floor_top:
+                player.center_y = self._floor_top + half_h
                 self.vel_y = 0.0
                 self.on_ground = True
         else:
-            hits = arcade.check_for_collision_with_list(self.player, self.ceiling_collision)
-            if hits and self.vel_y >= 0:
-                bottom = min(h.bottom for h in hits)
-                self.player.center_y = bottom - self.player.height / 2
+            if self.vel_y >= 0 and player.center_y + half_h >= self._ceiling_bottom:
+                player.center_y = self._ceiling_bottom - half_h
                 self.vel_y = 0.0
                 self.on_ground = True
 
@@ -424,66 +545,109 @@ class GameView(arcade.View):
             else:
                 self.jump_buffer_timer -= dt
 
-        # Dust & animations
+        # Dust & animations; textures are only reassigned on a frame flip,
+        # since every texture write dirties the sprite's GPU data.
         self._emit_dust(dt)
-        coin_frame = 0 if int(self.coin_anim_t * 6) % 2 == 0 else 1
-        for c in self.coins:
-            c.texture = self.tex_coin[coin_frame]
+        while self.coin_anim_t >= self._next_coin_flip:
+            self._next_coin_flip += 1 / 6
+            self._coin_frame ^= 1
+            tex = self.tex_coin[self._coin_frame]
+            for c in self.coins:
+                c.texture = tex
+        while self.player_anim_t >= self._next_player_flip:
+            self._next_player_flip += 1 / 8
+            self._player_frame ^= 1
         if self.on_ground:
-            run_frame = 0 if int(self.player_anim_t * 8) % 2 == 0 else 1
-            self.player.texture = self.tex_player_run[run_frame]
+            target = self.tex_player_run[self._player_frame]
         else:
-            self.player.texture = self.tex_player_idle
-        self.player.angle = 180 if self.gravity_dir < 0 else 0
-
-        # Coins
-        for coin in arcade.check_for_collision_with_list(self.player, self.coins):
-            self._emit_coin_sparkles(coin.center_x, coin.center_y)
-            coin.remove_from_sprite_lists()
-            self.score += 10
-
-        # Speed portals
-        for portal in arcade.check_for_collision_with_list(self.player, self.portals):
-            self.scroll_speed = float(getattr(portal, "properties", {}).get("speed", self.scroll_speed))
-            portal.remove_from_sprite_lists()
-
-        # Gravity portals
-        for gport in arcade.check_for_collision_with_list(self.player, self.gravity_portals):
-            new_dir = int(getattr(gport, "properties", {}).get("dir", -self.gravity_dir))
-            if new_dir not in (1, -1):
-                new_dir = -self.gravity_dir
-            if new_dir != self.gravity_dir:
-                self.gravity_dir = new_dir
-                self.vel_y = 0.0
-            gport.remove_from_sprite_lists()
-
-        # Jump pads
-        for pad in arcade.check_for_collision_with_list(self.player, self.jump_pads):
-            strength = float(getattr(pad, "properties", {}).get("strength", 1.0))
-            target_v = JUMP_VEL * self.gravity_dir * strength
-            if (self.gravity_dir > 0 and self.vel_y < target_v) or (self.gravity_dir < 0 and self.vel_y > target_v):
-                self.vel_y = target_v
-            self.on_ground = False
-            self.coyote_timer = 0.0
-            pad.remove_from_sprite_lists()
+            target = self.tex_player_idle
+        if player.texture is not target:
+            player.texture = target
+        angle = 180 if self.gravity_dir < 0 else 0
+        if player.angle != angle:
+            player.angle = angle
+
+        # Coins: the list stays sorted by x, so bisect to the overlap window
+        # and test just those few sprites instead of scanning the whole list.
+        coins = self.coins
+        if coins:
+            x_hi = player.right + COIN_SIZE / 2
+            y_reach = (player.height + COIN_SIZE) / 2
+            i = bisect_left(coins, player.left - COIN_SIZE / 2, key=_sprite_x)
+            while i < len(coins):
+                coin = coins[i]
+                if coin.center_x > x_hi:
+                    break
+                if abs(coin.center_y - player.center_y) < y_reach:
+                    self._emit_coin_sparkles(coin.center_x, coin.center_y)
+                    coin.remove_from_sprite_lists()
+                    self.score += 10
+                    continue  # the list shrank; i now points at the next coin
+                i += 1
+
+
+        # Triggers: one windowed scan shared by all three kinds. Each list
+        # stays sorted by x, so the scan stops at the first sprite past the
+        # player and hits dispatch to the matching handler.
+        p_left = player.left; p_right = player.right
+        p_bottom = player.bottom; p_top = player.top
+        for lst, on_hit in self._trigger_scans:
+            i = 0
+            while i < len(lst):
+                trig = lst[i]
+                if trig.left > p_right:
+                    break
+                if trig.right > p_left and trig.bottom < p_top and trig.top > p_bottom:
+                    on_hit(trig)
+                    trig.remove_from_sprite_lists()
+                    continue
+                i += 1
 
         # Death / OOB
-        if (arcade.check_for_collision_with_list(self.player, self.obstacles)
-            or self.player.center_y < -200 or self.player.center_y > HEIGHT + 200):
+        # Obstacle rects are sorted by x: scan from the left, stop at the first
+        # one past the player, and AABB-test the one or two actually in range.
+        hit = False
+        for left, right, bottom, top in self.obstacle_rects:
+            if left > p_right:
+                break
+            if right > p_left and bottom < p_top and top > p_bottom:
+                hit = True
+                break
+        if hit or player.center_y < -200 or player.center_y > HEIGHT + 200:
             self.alive = False
-            self._emit_death_burst(self.player.center_x, self.player.center_y)
+            if self.dead_text is None:
+                self.dead_text = arcade.Text("You Died  -  Press R to Restart",
+                                             WIDTH / 2, HEIGHT / 2 + 40, PINK, 28, anchor_x="center")
+                self.help_text = arcade.Text("SPACE/Click = Jump   ESC = Pause   M = Menu",
+                                             WIDTH / 2, HEIGHT / 2 - 6, GRAY, 18, anchor_x="center")
+            self._emit_death_burst(player.center_x, player.center_y)
 
         self._update_particles(dt)
         self._update_shake(dt)
+        self._refresh_score_text()
+
+    def _refresh_score_text(self):
+        # String build and glyph re-layout happen here, off the draw path,
+        # and only when the displayed value actually changes.
+        live_score = int(self.time_alive * 10) + self.score
+        if live_score != self._score_shown:
+            self._score_shown = live_score
+            self.score_text.text = f"Score: {live_score}"
 
     def _update_particles(self, dt: float):
-        for lst, g in ((self.dust_particles, -400.0),
-                       (self.sparkle_particles, 0.0),
-                       (self.death_particles, -300.0)):
-            for p in list(lst):
-                p.update(dt, gravity=g)
+        # Gravity travels with each particle, so all three pools share one
+        # update body. Single pass; collect expired particles instead of
+        # copying the whole list every frame just to mutate it while
+        # iterating.
+        for lst in (self.dust_particles, self.sparkle_particles,
+                    self.death_particles):
+            dead = []
+            for p in lst:
+                p.step(dt)
                 if not p.alive:
-                    lst.remove(p)
+                    dead.append(p)
+            for p in dead:
+                p.remove_from_sprite_lists()
 
     def _update_shake(self, dt: float):
         if self.shake_time > 0:
@@ -496,41 +660,35 @@ class GameView(arcade.View):
             amp = self.shake_intensity * (self.shake_time / 0.35)
             dx = random.uniform(-amp, amp); dy = random.uniform(-amp, amp)
 
-        self._apply_offset(dx, dy)
-        try:
-            # background and ground
-            self.bg_list.draw()
-            self.ground_tiles.draw()
-
-            # world objects behind player
-            self.portals.draw()
-            self.gravity_portals.draw()
-            self.jump_pads.draw()
-
-            # obstacles, spikes, coins, player
-            self.obstacles.draw()
-            self.spikes.draw()
-            self.coins.draw()
-            self.player_list.draw()
-
-            # particles
-            for p in self.dust_particles: p.draw(dx, dy)
-            for p in self.sparkle_particles: p.draw(dx, dy)
-            for p in self.death_particles: p.draw(dx, dy)
-        finally:
-            self._apply_offset(-dx, -dy)
+        # Shake is a render-only camera offset; no sprite is ever moved for it.
+        self.camera.position = (self.world_left + WIDTH / 2 - dx, HEIGHT / 2 - dy)
+
+        # Background and ground band stay in screen space; world sprites draw
+        # under the camera. The band tracks the camera through its UV phase.
+        self.background.draw()
+        self.ground.draw(self.world_left - dx, dy)
+        self.camera.use()
+
+        # world objects behind player
+        self.portals.draw()
+        self.gravity_portals.draw()
+        self.jump_pads.draw()
+
+        # obstacles, spikes, coins, player
+        self.obstacle_shapes.draw()
+        self.spikes.draw()
+        self.coins.draw()
+        self.player_list.draw()
+
+        # particles (one batched draw per pool)
+        self.dust_particles.draw()
+        self.sparkle_particles.draw()
+        self.death_particles.draw()
+
+        self.window.default_camera.use()
 
-        live_score = int(self.time_alive * 10) + self.score
-        self.score_text.text = f"Score: {live_score}"
         self.score_text.draw()
         if not self.alive:
             self.dead_text.draw()
             self.help_text.draw()
 
-    def _apply_offset(self, dx: float, dy: float):
-        if dx == 0 and dy == 0: return
-        for lst in (self.bg_list, self.ground_tiles, self.ground_collision, self.ceiling_collision,
-                    self.obstacles, self.spikes, self.player_list,
-                    self.coins, self.portals, self.gravity_portals, self.jump_pads):
-            for s in lst:
-                s.center_x += dx; s.center_y += dy
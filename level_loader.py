@@ -4,11 +4,21 @@ import json
 from pathlib import Path
 from typing import Any, Dict
 
+# Parsed levels keyed by (path, mtime): new views reuse the cached dict
+# instead of re-reading and re-parsing, while an edited file still reloads.
+_CACHE: Dict[str, tuple[float, Dict[str, Any]]] = {}
+
 def load_level(path: str | Path) -> Dict[str, Any]:
     p = Path(path)
+    key = str(p)
+    mtime = p.stat().st_mtime
+    cached = _CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     with p.open("r", encoding="utf-8") as f:
         data = json.load(f)
     # basic validation
     if "obstacles" not in data or not isinstance(data["obstacles"], list):
         raise ValueError("Level JSON must include an 'obstacles' list")
+    _CACHE[key] = (mtime, data)
     return data
@@ -2,22 +2,15 @@
 from pathlib import Path
 import arcade
 from settings import WIDTH, HEIGHT, TITLE, WHITE, GRAY
+from background import ScrollingBackground
 
 ASSETS_DIR = Path(__file__).parent / "assets"
 
 class MenuView(arcade.View):
     def __init__(self):
         super().__init__()
-        # Background (two scrolling sprites)
-        self.bg_list = arcade.SpriteList()
-        self.bg_tex = arcade.load_texture(str(ASSETS_DIR / "background.png"))
-        scale = HEIGHT / self.bg_tex.height
-        w = self.bg_tex.width * scale
-        for i in range(2):
-            s = arcade.Sprite(str(ASSETS_DIR / "background.png"), scale=scale)
-            s.center_x = i * w + w / 2
-            s.center_y = HEIGHT / 2
-            self.bg_list.append(s)
+        # Background: single UV-scrolled quad (same helper as the game view)
+        self.background = ScrollingBackground(ASSETS_DIR / "background.png", speed=20.0)
 
         # Title text
         self.title_text = arcade.Text(TITLE, WIDTH/2, HEIGHT*0.62, WHITE, 36, anchor_x="center")
@@ -30,19 +23,11 @@ class MenuView(arcade.View):
 
     def on_update(self, dt: float):
         # Slow background drift
-        speed = 20.0
-        dx = speed * dt
-        for s in self.bg_list:
-            s.center_x -= dx
-        if self.bg_list:
-            w = self.bg_list[0].width
-            for s in self.bg_list:
-                if s.right < 0:
-                    s.left += w * 2
+        self.background.update(dt)
 
     def on_draw(self):
         self.clear()
-        self.bg_list.draw()
+        self.background.draw()
         self.title_text.draw()
         self.sub_text.draw()
         self.help_text.draw()
@@ -1,6 +1,7 @@
 # pause_view.py
 import arcade
 from settings import WIDTH, HEIGHT, WHITE, GRAY
+from menu_view import MenuView
 
 class PauseView(arcade.View):
     def __init__(self, game_view: arcade.View):
@@ -21,5 +22,4 @@ class PauseView(arcade.View):
         if symbol == arcade.key.ESCAPE:
             self.window.show_view(self.game_view)
         elif symbol in (arcade.key.M,):
-            from menu_view import MenuView
             self.window.show_view(MenuView())
@@ -0,0 +1,19 @@
+# textures.py
+from __future__ import annotations
+from pathlib import Path
+
+import arcade
+
+ASSETS_DIR = Path(__file__).parent / "assets"
+
+# One decode + GL upload per asset for the whole process; every view that
+# needs a texture shares the cached copy instead of reloading the PNG.
+_CACHE: dict[str, arcade.Texture] = {}
+
+
+def load_texture(name: str) -> arcade.Texture:
+    tex = _CACHE.get(name)
+    if tex is None:
+        tex = arcade.load_texture(str(ASSETS_DIR / name))
+        _CACHE[name] = tex
+    return tex